@@ -2,22 +2,46 @@ import sys
 import json
 import parselmouth
 from parselmouth.praat import call
-import math
 import numpy as np
 
 # --- FUNÇÕES DE CONVERSÃO E VALIDAÇÃO ---
 
+NOTE_NAMES = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
+C0_HZ = 440 * pow(2, -4.75)
+
+def frequencies_to_semitones(frequencies):
+    """Converte um array de frequências (Hz) em semitons acima de C0, numa única passada vetorizada."""
+    return 12 * np.log2(np.asarray(frequencies, dtype=float) / C0_HZ)
+
+def semitone_to_note(semitone):
+    """Converte um índice de semitom (acima de C0) para a notação musical (ex: A4)."""
+    octave, note_index = divmod(int(semitone), 12)
+    return f"{NOTE_NAMES[note_index]}{octave}"
+
 def frequency_to_note(frequency):
     """Converte frequência em Hertz para a notação musical (ex: A4)."""
     if not isinstance(frequency, (int, float)) or frequency <= 0 or np.isnan(frequency):
         return "N/A"
-    A4 = 440
-    C0 = A4 * pow(2, -4.75)
-    note_names = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
-    half_steps = round(12 * math.log2(frequency / C0))
-    octave = half_steps // 12
-    note_index = half_steps % 12
-    return f"{note_names[note_index]}{octave}"
+    return semitone_to_note(np.rint(frequencies_to_semitones(frequency)))
+
+def tessitura_histogram(valid_pitches, frame_step):
+    """
+    Mapeia cada frame vozeado para a nota mais próxima e soma o tempo gasto em cada nota.
+    Retorna a lista contínua (do grave ao agudo) de {"note", "semitone", "seconds"}.
+    Custo linear no número de frames (np.bincount).
+    """
+    semitones = np.rint(frequencies_to_semitones(valid_pitches)).astype(int)
+    lowest = semitones.min()
+    counts = np.bincount(semitones - lowest)
+    return [
+        {"note": semitone_to_note(lowest + i), "semitone": int(lowest + i), "seconds": float(count * frame_step)}
+        for i, count in enumerate(counts)
+    ]
+
+def robust_pitch_range(valid_pitches, low_percentile=5, high_percentile=95):
+    """Limites da extensão por percentis, ignorando picos isolados (erros de detecção, ruídos)."""
+    low_hz, high_hz = np.percentile(valid_pitches, [low_percentile, high_percentile])
+    return float(low_hz), float(high_hz)
 
 def hz_to_semitones_stdev(valid_pitches, ref_hz=100.0):
     """Calcula o desvio padrão da afinação em Semitons (Variação Semitonal)."""
@@ -59,6 +83,7 @@ def check_vocal_health(jitter, shimmer, hnr):
 
 PITCH_FLOOR = 50.0
 PITCH_CEILING = 800.0
+PITCH_TIME_STEP = 0.01
 
 try:
     filename = sys.argv[1]
@@ -82,7 +107,7 @@ try:
     duration = sound.get_total_duration()
     
     # 1. DETECÇÃO ROBUSTA DE PITCH (F0)
-    pitch = sound.to_pitch_ac(pitch_floor=PITCH_FLOOR, pitch_ceiling=PITCH_CEILING, time_step=0.01)
+    pitch = sound.to_pitch_ac(pitch_floor=PITCH_FLOOR, pitch_ceiling=PITCH_CEILING, time_step=PITCH_TIME_STEP)
     
     pitch_values_all = pitch.selected_array['frequency']
     valid_pitches = pitch_values_all[pitch_values_all > 0]
@@ -171,15 +196,17 @@ try:
     if exercise_type == "extensao_afinacao":
         # Combina "analise_extensao" e "teste_vogais"
         
-        # A. Análise de Extensão (pitch range)
-        min_pitch_hz = np.min(valid_pitches)
-        max_pitch_hz = np.max(valid_pitches)
+        # A. Análise de Extensão (pitch range) - percentis em vez de min/max brutos
+        min_pitch_hz, max_pitch_hz = robust_pitch_range(valid_pitches)
 
         results["range_data"] = {
             "min_pitch_hz": min_pitch_hz,
             "max_pitch_hz": max_pitch_hz,
             "min_pitch_note": frequency_to_note(min_pitch_hz),
-            "max_pitch_note": frequency_to_note(max_pitch_hz)
+            "max_pitch_note": frequency_to_note(max_pitch_hz),
+            "absolute_min_pitch_hz": float(np.min(valid_pitches)),
+            "absolute_max_pitch_hz": float(np.max(valid_pitches)),
+            "tessitura": tessitura_histogram(valid_pitches, PITCH_TIME_STEP)
         }
         
         # B. Análise de Vogais (Formantes no "A-E-I-O-U" - usando 5 intervalos)
@@ -69,6 +69,11 @@ def generate_recommendations(data):
         if min_note != "N/A" and max_note != "N/A":
             recomendacoes.append(f"• <b>Seu Alcance:</b> Você explorou notas desde <b>{min_note}</b> até <b>{max_note}</b>. <b>Dica:</b> O aquecimento vocal é essencial. Para expandir seu alcance, pratique exercícios de escalas que ultrapassem levemente suas notas mais agudas e graves de forma suave.")
 
+        tessitura = range_data.get("tessitura", [])
+        if tessitura:
+            comfort = max(tessitura, key=lambda t: t["seconds"])
+            recomendacoes.append(f"• <b>Sua Tessitura:</b> A nota em que você passou mais tempo foi <b>{comfort['note']}</b> ({round(comfort['seconds'], 1)}s). Essa é a região onde sua voz fica mais à vontade. <b>Dica:</b> Use-a como ponto de partida nos aquecimentos e expanda aos poucos para as notas vizinhas.")
+
         vowel_data = data.get("vowel_space_data", {})
         if len(vowel_data) >= 3 and vowel_data.get('a', {}).get('f1') != 'N/A':
             recomendacoes.append("• <b>Clareza de Vogais:</b> O seu 'triângulo vocálico' (mapa F1/F2) mostra a distinção entre suas vogais. <b>Dica:</b> Para melhorar a dicção, tente exagerar a forma das vogais para aumentar o contraste entre elas.")
@@ -174,34 +179,59 @@ def draw_vowel_space_chart(vowel_data):
     buf = io.BytesIO(); plt.savefig(buf, format='png', dpi=150); buf.seek(0); plt.close(fig)
     return buf
 
+NOTE_NAMES = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
+
+def note_to_semitone(note):
+    """Converte uma nota (ex: "C#4") no índice de semitons acima de C0. Retorna None se inválida."""
+    try:
+        name = note.rstrip("0123456789")
+        return NOTE_NAMES.index(name) + 12 * int(note[len(name):])
+    except (ValueError, AttributeError):
+        return None
+
+def semitone_to_note(semitone):
+    """Converte um índice de semitons acima de C0 na nota (ex: A4)."""
+    octave, note_index = divmod(int(semitone), 12)
+    return f"{NOTE_NAMES[note_index]}{octave}"
+
 def draw_vocal_range_chart(range_data):
-    """Cria um gráfico de barra horizontal para a extensão vocal."""
-    min_note = range_data.get("min_pitch_note", "N/A")
-    max_note = range_data.get("max_pitch_note", "N/A")
+    """Cria o gráfico da extensão vocal: tempo cantado em cada nota (tessitura) e a faixa do alcance."""
+    y_min = note_to_semitone(range_data.get("min_pitch_note", "N/A"))
+    y_max = note_to_semitone(range_data.get("max_pitch_note", "N/A"))
     
-    if min_note == "N/A" or max_note == "N/A": return None
+    if y_min is None or y_max is None: return None
     
-    notes = ["G2", "G#2", "A2", "A#2", "B2", "C3", "C#3", "D3", "D#3", "E3", "F3", "F#3", "G3", "G#3", "A3", "A#3", "B3", "C4", "C#4", "D4", "D#4", "E4", "F4", "F#4", "G4", "G#4", "A4", "A#4", "B4", "C5", "C#5", "D5"]
+    tessitura = range_data.get("tessitura", [])
+    tess_semitones = [t["semitone"] for t in tessitura]
+    tess_seconds = [t["seconds"] for t in tessitura]
     
-    try:
-        y_min = notes.index(min_note)
-        y_max = notes.index(max_note)
-    except ValueError:
-        return None
+    # O eixo cobre tudo o que foi cantado, com uma nota de folga de cada lado
+    first = min([y_min] + tess_semitones) - 1
+    last = max([y_max] + tess_semitones) + 1
+    semitones = np.arange(first, last + 1)
 
     fig, ax = plt.subplots(figsize=(8, 3))
     
-    ax.barh("Sua Extensão", width=y_max - y_min, left=y_min, color='#2E86C1', height=0.5)
+    ax.axvspan(y_min - 0.5, y_max + 0.5, color='#AED6F1', alpha=0.5, label="Sua Extensão")
+    
+    if tessitura:
+        ax.bar(tess_semitones, tess_seconds, width=0.8, color='#2E86C1', label="Tempo em cada nota")
+        ax.set_ylabel("Tempo (segundos)", fontsize=10)
+        label_y = max(tess_seconds)
+    else:
+        ax.set_yticks([])
+        label_y = 1.0
     
     ax.set_title("Seu Alcance Vocal", fontsize=14, fontweight='bold')
     ax.set_xlabel("Notas Musicais", fontsize=10)
-    ax.set_yticks([]) 
-    ax.set_xticks(range(len(notes)))
-    ax.set_xticklabels(notes, rotation=45, ha='right', fontsize=8)
-    ax.set_xlim(-0.5, len(notes) - 0.5)
+    ax.set_xticks(semitones)
+    ax.set_xticklabels([semitone_to_note(s) for s in semitones], rotation=45, ha='right', fontsize=8 if len(semitones) <= 36 else 6)
+    ax.set_xlim(first - 0.5, last + 0.5)
+    ax.set_ylim(0, label_y * 1.2)
     
-    ax.text(y_min, "Sua Extensão", min_note, ha='center', va='bottom', color='#2E86C1', fontweight='bold', fontsize=10, transform=ax.transData)
-    ax.text(y_max, "Sua Extensão", max_note, ha='center', va='bottom', color='#2E86C1', fontweight='bold', fontsize=10, transform=ax.transData)
+    ax.text(y_min, label_y * 1.05, semitone_to_note(y_min), ha='center', va='bottom', color='#1F618D', fontweight='bold', fontsize=10)
+    ax.text(y_max, label_y * 1.05, semitone_to_note(y_max), ha='center', va='bottom', color='#1F618D', fontweight='bold', fontsize=10)
+    ax.legend(loc='upper left', fontsize=8)
     
     plt.tight_layout(pad=1.0)
     buf = io.BytesIO()